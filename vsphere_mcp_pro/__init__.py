@@ -5,7 +5,14 @@ This package provides a Model Context Protocol (MCP) server for VMware vCenter
 operations including VM lifecycle management, snapshots, and inventory discovery.
 """
 
-from .vsphere_client import VsphereApiError, VsphereClient, VsphereClientPool
+from .vsphere_client import (
+    AsyncVsphereClient,
+    AsyncVsphereClientPool,
+    SessionTokenCache,
+    VsphereApiError,
+    VsphereClient,
+    VsphereClientPool,
+)
 from .config import AppConfig, load_config
 from .authz import Authorizer, TokenBucketLimiter
 from .audit import Auditor, AuditEvent
@@ -16,7 +23,10 @@ __all__ = [
     # Client
     "VsphereClient",
     "VsphereClientPool",
+    "AsyncVsphereClient",
+    "AsyncVsphereClientPool",
     "VsphereApiError",
+    "SessionTokenCache",
     # Config
     "AppConfig",
     "load_config",
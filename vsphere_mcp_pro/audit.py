@@ -1,15 +1,37 @@
 from __future__ import annotations
 
+import atexit
 import json
+import queue
+import re
 import sys
-import time
-from dataclasses import asdict, dataclass
+import threading
+from dataclasses import dataclass, fields
 from typing import Any, Dict, Optional
 
 from .authz import get_caller
 
+try:
+    import orjson
 
-@dataclass
+    def _dumps_line(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:  # fall back to stdlib json if orjson is unavailable
+
+    def _dumps_line(data: Dict[str, Any]) -> bytes:
+        return (json.dumps(data) + "\n").encode()
+
+
+# Arg names matching this are redacted from audit output.
+_SENSITIVE = re.compile(r"password|token", re.IGNORECASE)
+
+# Flush whenever this many events are pending or this much time has passed.
+_FLUSH_BATCH = 256
+_FLUSH_INTERVAL_S = 0.25
+_BUFFER_BYTES = 65536
+
+
+@dataclass(slots=True)
 class AuditEvent:
     ts: float
     tool: str
@@ -20,14 +42,67 @@ class AuditEvent:
     host: Optional[str] = None
     role: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        # Redact sensitive args up front so the encode path is a straight
+        # serialize-and-write.
+        args = self.args
+        for k in args:
+            if _SENSITIVE.search(k):
+                args[k] = "***"
+
+
+# Serialization key order, computed once; slotted instances have no __dict__.
+_FIELDS = tuple(f.name for f in fields(AuditEvent))
+
 
 class Auditor:
+    """Buffered JSONL audit sink.
+
+    Events are queued by the calling thread and serialized + written in
+    batches by a background daemon thread, so JSON encoding and file I/O
+    stay off the tool-call path. The queue is drained on close() and at
+    process exit.
+    """
+
     def __init__(self, path: Optional[str] = None):
-        self._sink = open(path, "a", buffering=1) if path else sys.stdout
+        self._sink = open(path, "ab", buffering=_BUFFER_BYTES) if path else sys.stdout.buffer
+        self._owns_sink = path is not None
+        self._queue: "queue.SimpleQueue[Optional[AuditEvent]]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._drain, name="audit-flush", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
 
     def log(self, event: AuditEvent) -> None:
-        data = asdict(event)
-        for k in list(data.get("args", {}).keys()):
-            if "password" in k.lower() or "token" in k.lower():
-                data["args"][k] = "***"
-        self._sink.write(json.dumps(data) + "\n")
+        self._queue.put(event)
+
+    def close(self) -> None:
+        """Flush pending events and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5.0)
+
+    def _drain(self) -> None:
+        q = self._queue
+        sink = self._sink
+        stop = False
+        while not stop:
+            try:
+                item = q.get(timeout=_FLUSH_INTERVAL_S)
+            except queue.Empty:
+                continue
+            batch = []
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= _FLUSH_BATCH:
+                    break
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+            else:
+                stop = True
+            if batch:
+                sink.write(b"".join(_dumps_line({k: getattr(ev, k) for k in _FIELDS}) for ev in batch))
+                sink.flush()
+        if self._owns_sink:
+            sink.close()
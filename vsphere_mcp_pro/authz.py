@@ -1,47 +1,87 @@
 from __future__ import annotations
 
+import functools
 import threading
 import time
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from .config import AuthConfig, RateLimitConfig
 
-_thread_ctx = threading.local()
+# Caller identity is stored as a plain (token, role, remote) tuple; a
+# ContextVar propagates correctly across threads and async tasks, unlike
+# the previous threading.local.
+_caller_var: ContextVar[Tuple[Optional[str], Optional[str], Optional[str]]] = ContextVar(
+    "caller", default=(None, None, None)
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class CallerContext:
     token: Optional[str]
     role: Optional[str]
     remote: Optional[str] = None
 
 
-def set_caller(ctx: CallerContext) -> None:
-    _thread_ctx.caller = ctx
+_DEFAULT_CALLER = CallerContext(token=None, role=None)
+
+
+def set_caller(token: Optional[str], role: Optional[str], remote: Optional[str] = None) -> None:
+    _caller_var.set((token, role, remote))
 
 
 def get_caller() -> CallerContext:
-    return getattr(_thread_ctx, "caller", CallerContext(token=None, role=None))
+    token, role, remote = _caller_var.get()
+    if token is None and role is None and remote is None:
+        return _DEFAULT_CALLER
+    return CallerContext(token=token, role=role, remote=remote)
+
+
+_EMPTY: frozenset = frozenset()
 
 
 class Authorizer:
     def __init__(self, auth: AuthConfig):
         self._tokens = auth.tokens_to_roles
-        self._roles = auth.roles_to_tools
         self._enforce = auth.enforce
-
-    def resolve_role(self, token: Optional[str]) -> Optional[str]:
+        # Invert roles->tools once so the hot check is a single dict lookup
+        # plus a frozenset membership test, with no per-call allocation.
+        tool_to_roles: Dict[str, set] = {}
+        for role, tools in auth.roles_to_tools.items():
+            for tool in tools:
+                tool_to_roles.setdefault(tool, set()).add(role)
+        self._tool_to_roles: Dict[str, frozenset] = {t: frozenset(r) for t, r in tool_to_roles.items()}
+        # tokens_to_roles is immutable after config load, so hot token->role
+        # lookups can sit in a C-level LRU cache on the instance.
+        self.resolve_role = functools.lru_cache(maxsize=1024)(self._resolve_role)
+
+    @property
+    def enforce(self) -> bool:
+        return self._enforce
+
+    def _resolve_role(self, token: Optional[str]) -> Optional[str]:
         if not token:
             return None
         return self._tokens.get(token)
 
+    def roles_for(self, tool_name: str) -> frozenset:
+        """Roles permitted to call the given tool (empty if none)."""
+        return self._tool_to_roles.get(tool_name, _EMPTY)
+
     def is_allowed(self, tool_name: str, role: Optional[str]) -> bool:
         if not self._enforce:
             return True
-        if not role:
-            return False
-        return tool_name in self._roles.get(role, set())
+        return role is not None and role in self._tool_to_roles.get(tool_name, _EMPTY)
+
+
+class _Bucket:
+    __slots__ = ("lock", "tokens", "ts")
+
+    def __init__(self, tokens: float, ts: float):
+        self.lock = threading.Lock()
+        self.tokens = tokens
+        self.ts = ts
 
 
 class TokenBucketLimiter:
@@ -49,19 +89,28 @@ class TokenBucketLimiter:
         self.enabled = cfg.enabled
         self.rate = cfg.rate_per_sec
         self.burst = cfg.burst
-        self._buckets: Dict[str, Dict[str, float]] = {}
-        self._lock = threading.Lock()
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()  # guards bucket creation only
 
     def allow(self, key: str) -> bool:
         if not self.enabled:
             return True
         now = time.monotonic()
-        with self._lock:
-            b = self._buckets.setdefault(key, {"tokens": float(self.burst), "ts": now})
-            elapsed = now - b["ts"]
-            b["tokens"] = min(self.burst, b["tokens"] + elapsed * self.rate)
-            b["ts"] = now
-            if b["tokens"] >= 1.0:
-                b["tokens"] -= 1.0
+        b = self._buckets.get(key)
+        if b is None:
+            # Double-checked insert so concurrent callers share one bucket.
+            with self._lock:
+                b = self._buckets.get(key)
+                if b is None:
+                    b = self._buckets[key] = _Bucket(float(self.burst), now)
+        with b.lock:
+            tokens = b.tokens
+            if tokens < self.burst:
+                # Only pay the refill math when the bucket isn't already full.
+                tokens = min(self.burst, tokens + (now - b.ts) * self.rate)
+            b.ts = now
+            if tokens >= 1.0:
+                b.tokens = tokens - 1.0
                 return True
+            b.tokens = tokens
             return False
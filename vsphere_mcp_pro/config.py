@@ -1,43 +1,60 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
+from dataclasses import dataclass, field
 from typing import Dict, Optional, Set
 
-from pydantic import BaseModel, Field, field_validator
+_TRUE = frozenset({"1", "true", "yes"})
+_env = os.environ.get
 
 
-class AuthConfig(BaseModel):
-    tokens_to_roles: Dict[str, str] = Field(default_factory=dict)
-    roles_to_tools: Dict[str, Set[str]] = Field(default_factory=dict)
+def _default_pool_maxsize() -> int:
+    # Mirrors ThreadPoolExecutor's default worker sizing.
+    return max(10, (os.cpu_count() or 1) * 5)
+
+
+@dataclass(slots=True)
+class AuthConfig:
+    tokens_to_roles: Dict[str, str] = field(default_factory=dict)
+    roles_to_tools: Dict[str, Set[str]] = field(default_factory=dict)
     enforce: bool = True
 
-    @field_validator("roles_to_tools", mode="before")
-    @classmethod
-    def coerce_sets(cls, v):
-        return {k: set(vv) for k, vv in (v or {}).items()}
+    def __post_init__(self) -> None:
+        # Accept lists (e.g. from ROLES_TO_TOOLS JSON) and coerce to sets.
+        self.roles_to_tools = {k: set(v) for k, v in (self.roles_to_tools or {}).items()}
 
 
-class RateLimitConfig(BaseModel):
+@dataclass(slots=True)
+class RateLimitConfig:
     enabled: bool = True
     rate_per_sec: float = 5.0
     burst: int = 10
 
 
-class VsphereConfig(BaseModel):
+@dataclass(slots=True)
+class VsphereConfig:
     host: str
     user: str
     password: str
-    api_mode: str = Field(default="api")  # "api" | "rest"
+    api_mode: str = "api"  # "api" | "rest"
     verify_ssl: bool = True
     ca_bundle: Optional[str] = None
     default_timeout_s: float = 20.0
     request_retries: int = 3
     backoff_factor: float = 0.5
-    allowed_hosts: Set[str] = Field(default_factory=set)
+    pool_maxsize: int = field(default_factory=_default_pool_maxsize)
+    transport: str = "requests"  # "requests" | "httpx" (HTTP/2, needs the http2 extra)
+    session_cache_path: Optional[str] = None
+    session_cache_ttl_s: float = 1500.0  # just under vCenter's 30-min idle timeout
+    list_cache_ttl_s: float = 5.0  # TTL for cached list_* inventory reads; 0 disables
+    keepalive_interval_s: float = 240.0  # 0 disables the idle-session pinger
+    allowed_hosts: Set[str] = field(default_factory=set)
 
 
-class ServerConfig(BaseModel):
+@dataclass(slots=True)
+class ServerConfig:
     name: str = "vsphere-mcp-pro"
     host: str = "0.0.0.0"
     port: int = 8000
@@ -46,7 +63,8 @@ class ServerConfig(BaseModel):
     verbose_default: bool = False
 
 
-class AppConfig(BaseModel):
+@dataclass(slots=True)
+class AppConfig:
     vsphere: VsphereConfig
     auth: AuthConfig
     ratelimit: RateLimitConfig
@@ -54,16 +72,19 @@ class AppConfig(BaseModel):
 
 
 def _env_json(name: str):
-    v = os.getenv(name)
+    v = _env(name)
     if not v:
         return None
     return json.loads(v)
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> AppConfig:
-    allowed_hosts = set()
-    if os.getenv("ALLOWED_VCENTER_HOSTS"):
-        allowed_hosts = {h.strip() for h in os.getenv("ALLOWED_VCENTER_HOSTS", "").split(",") if h.strip()}
+    # Env input is trusted here: the dataclass constructors below perform no
+    # schema validation (the coercions they do need live in __post_init__).
+    host_raw = _env("VCENTER_HOST", "").strip()
+
+    allowed_hosts = {h.strip() for h in _env("ALLOWED_VCENTER_HOSTS", "").split(",") if h.strip()}
 
     roles_to_tools = _env_json("ROLES_TO_TOOLS") or {
         "read": {
@@ -84,34 +105,40 @@ def load_config() -> AppConfig:
 
     cfg = AppConfig(
         vsphere=VsphereConfig(
-            host=os.getenv("VCENTER_HOST", "").strip() or "CHANGE_ME",
-            user=os.getenv("VCENTER_USER", ""),
-            password=os.getenv("VCENTER_PASSWORD", ""),
-            api_mode=os.getenv("VSPHERE_API_MODE", "api").lower(),
-            verify_ssl=os.getenv("INSECURE", "false").lower() not in {"1", "true", "yes"},
-            ca_bundle=os.getenv("VCENTER_CA_BUNDLE"),
-            default_timeout_s=float(os.getenv("VCENTER_TIMEOUT_S", "20")),
-            request_retries=int(os.getenv("VCENTER_RETRIES", "3")),
-            backoff_factor=float(os.getenv("VCENTER_BACKOFF", "0.5")),
-            allowed_hosts=allowed_hosts or {os.getenv("VCENTER_HOST", "").strip()} - {""},
+            host=host_raw or "CHANGE_ME",
+            user=_env("VCENTER_USER", ""),
+            password=_env("VCENTER_PASSWORD", ""),
+            api_mode=_env("VSPHERE_API_MODE", "api").lower(),
+            verify_ssl=_env("INSECURE", "false").lower() not in _TRUE,
+            ca_bundle=_env("VCENTER_CA_BUNDLE"),
+            default_timeout_s=float(_env("VCENTER_TIMEOUT_S", "20")),
+            request_retries=int(_env("VCENTER_RETRIES", "3")),
+            backoff_factor=float(_env("VCENTER_BACKOFF", "0.5")),
+            pool_maxsize=int(_env("VCENTER_POOL_MAXSIZE") or 0) or _default_pool_maxsize(),
+            transport=_env("VSPHERE_TRANSPORT", "requests").lower(),
+            session_cache_path=_env("VSPHERE_SESSION_CACHE_PATH"),
+            session_cache_ttl_s=float(_env("VSPHERE_SESSION_CACHE_TTL_S", "1500")),
+            list_cache_ttl_s=float(_env("VSPHERE_LIST_CACHE_TTL_S", "5")),
+            keepalive_interval_s=float(_env("VSPHERE_KEEPALIVE_S", "240")),
+            allowed_hosts=allowed_hosts or {host_raw} - {""},
         ),
         auth=AuthConfig(
             tokens_to_roles=tokens_to_roles,
             roles_to_tools=roles_to_tools,
-            enforce=os.getenv("AUTH_ENFORCE", "true").lower() in {"1", "true", "yes"},
+            enforce=_env("AUTH_ENFORCE", "true").lower() in _TRUE,
         ),
         ratelimit=RateLimitConfig(
-            enabled=os.getenv("RATE_LIMIT", "true").lower() in {"1", "true", "yes"},
-            rate_per_sec=float(os.getenv("RATE_LIMIT_RPS", "5")),
-            burst=int(os.getenv("RATE_LIMIT_BURST", "10")),
+            enabled=_env("RATE_LIMIT", "true").lower() in _TRUE,
+            rate_per_sec=float(_env("RATE_LIMIT_RPS", "5")),
+            burst=int(_env("RATE_LIMIT_BURST", "10")),
         ),
         server=ServerConfig(
-            name=os.getenv("SERVER_NAME", "vsphere-mcp-pro"),
-            host=os.getenv("SERVER_HOST", "0.0.0.0"),
-            port=int(os.getenv("SERVER_PORT", "8000")),
-            mcp_path=os.getenv("MCP_PATH", "/mcp"),
-            audit_log_path=os.getenv("AUDIT_LOG_PATH"),
-            verbose_default=os.getenv("VERBOSE_DEFAULT", "false").lower() in {"1", "true", "yes"},
+            name=_env("SERVER_NAME", "vsphere-mcp-pro"),
+            host=_env("SERVER_HOST", "0.0.0.0"),
+            port=int(_env("SERVER_PORT", "8000")),
+            mcp_path=_env("MCP_PATH", "/mcp"),
+            audit_log_path=_env("AUDIT_LOG_PATH"),
+            verbose_default=_env("VERBOSE_DEFAULT", "false").lower() in _TRUE,
         ),
     )
     if cfg.vsphere.host == "CHANGE_ME":
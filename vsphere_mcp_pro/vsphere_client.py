@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import atexit
+import json
 import logging
+import os
 import threading
 import time
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -12,11 +16,40 @@ from urllib3.util.retry import Retry
 
 from .config import AppConfig, VsphereConfig
 
+try:
+    from orjson import loads as _loads  # SIMD-accelerated; decodes straight from bytes
+except ImportError:  # fall back to stdlib json if orjson is unavailable
+    _loads = json.loads
+
+try:
+    import httpx  # optional HTTP/2 transport (install the "http2" extra)
+except ImportError:
+    httpx = None
+
+# Network-level failures across both transports.
+_TRANSPORT_ERRORS: tuple = (requests.RequestException,) + (
+    (httpx.HTTPError,) if httpx is not None else ()
+)
+
 logger = logging.getLogger(__name__)
 
+# Shared executor for client-side fan-out (inventory aggregation, bulk VM
+# lookups); sized to stay within the adapter's connection pool.
+_FANOUT_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="vsphere-fanout")
+
+
+_MISSING = object()  # sentinel: lazy VsphereApiError fields not yet computed
+
 
 class VsphereApiError(Exception):
-    """Exception raised when vCenter API returns an error response."""
+    """Exception raised when vCenter API returns an error response.
+
+    Only the raw inputs are stored at construction; parsing the body and
+    formatting the detail string are deferred until the exception is
+    actually rendered (or error_type/error_messages is read), so callers
+    that catch-and-test (e.g. ``is_not_found`` on a bulk lookup) don't pay
+    for a message they never show.
+    """
 
     def __init__(
         self,
@@ -28,58 +61,77 @@ class VsphereApiError(Exception):
         self.status_code = status_code
         self.response_body = response_body or {}
         self.path = path
-        
-        # Extract vCenter error details if available
-        self.error_type = self._extract_error_type()
-        self.error_messages = self._extract_error_messages()
-        
-        # Build detailed message
-        detail = f"HTTP {status_code}"
-        if path:
-            detail += f" on {path}"
+        self._error_type: Any = _MISSING
+        self._error_messages: Optional[List[str]] = None
+        super().__init__(message)
+
+    @property
+    def error_type(self) -> Optional[str]:
+        if self._error_type is _MISSING:
+            self._error_type = self._extract_error_type()
+        return self._error_type
+
+    @property
+    def error_messages(self) -> List[str]:
+        if self._error_messages is None:
+            self._error_messages = self._extract_error_messages()
+        return self._error_messages
+
+    def __str__(self) -> str:
+        detail = f"HTTP {self.status_code}"
+        if self.path:
+            detail += f" on {self.path}"
         if self.error_type:
             detail += f" [{self.error_type}]"
         if self.error_messages:
             detail += f": {'; '.join(self.error_messages)}"
-        
-        full_message = f"{message}: {detail}"
-        super().__init__(full_message)
+        return f"{self.args[0]}: {detail}"
 
     def _extract_error_type(self) -> Optional[str]:
         """Extract error type from vCenter response."""
+        rb = self.response_body
         # /api style: {"error_type": "NOT_FOUND", ...}
-        if "error_type" in self.response_body:
-            return self.response_body["error_type"]
+        error_type = rb.get("error_type")
+        if error_type is not None:
+            return error_type
         # /rest style: {"type": "com.vmware.vapi.std.errors.not_found", ...}
-        if "type" in self.response_body:
-            return self.response_body["type"].split(".")[-1].upper()
+        vapi_type = rb.get("type")
+        if vapi_type is not None:
+            return vapi_type.split(".")[-1].upper()
         # Nested value style
-        if "value" in self.response_body and isinstance(self.response_body["value"], dict):
-            return self.response_body["value"].get("error_type")
+        value = rb.get("value")
+        if isinstance(value, dict):
+            return value.get("error_type")
         return None
 
     def _extract_error_messages(self) -> List[str]:
         """Extract human-readable error messages from vCenter response."""
+        rb = self.response_body
         messages = []
-        
+
         # /api style: {"messages": [{"default_message": "..."}]}
-        if "messages" in self.response_body:
-            for msg in self.response_body.get("messages", []):
-                if isinstance(msg, dict) and "default_message" in msg:
-                    messages.append(msg["default_message"])
-                elif isinstance(msg, str):
-                    messages.append(msg)
-        
+        for msg in rb.get("messages") or ():
+            if isinstance(msg, dict):
+                default = msg.get("default_message")
+                if default is not None:
+                    messages.append(default)
+            elif isinstance(msg, str):
+                messages.append(msg)
+
         # /rest style: {"value": {"messages": [...]}}
-        if "value" in self.response_body and isinstance(self.response_body["value"], dict):
-            for msg in self.response_body["value"].get("messages", []):
-                if isinstance(msg, dict) and "default_message" in msg:
-                    messages.append(msg["default_message"])
-        
+        value = rb.get("value")
+        if isinstance(value, dict):
+            for msg in value.get("messages") or ():
+                if isinstance(msg, dict):
+                    default = msg.get("default_message")
+                    if default is not None:
+                        messages.append(default)
+
         # Simple message field
-        if "message" in self.response_body:
-            messages.append(self.response_body["message"])
-        
+        message = rb.get("message")
+        if message is not None:
+            messages.append(message)
+
         return messages
 
     @property
@@ -99,50 +151,275 @@ class VsphereApiError(Exception):
         return self.status_code == 409
 
 
+class SessionTokenCache:
+    """Shared cache of vCenter session tokens keyed by "user@host".
+
+    vCenter sessions stay valid for ~30 minutes of idle time, so freshly
+    constructed clients (process restarts, additional pool members) can reuse
+    a cached token after one cheap validity probe instead of paying a full
+    Basic-auth login that counts against vCenter's session limits. Entries
+    can optionally be persisted to a JSON file across restarts.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl_s: float = 1500.0):
+        self._path = path
+        self._ttl = ttl_s
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self._entries = json.load(f)
+            except Exception as e:
+                logger.warning("Could not load session cache %s: %s", path, e)
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached token for key, or None if absent/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry:
+                return None
+            if time.time() - entry["ts"] > self._ttl:
+                del self._entries[key]
+                return None
+            return entry["token"]
+
+    def put(self, key: str, token: str) -> None:
+        with self._lock:
+            self._entries[key] = {"token": token, "ts": time.time()}
+            self._persist()
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._persist()
+
+    def _persist(self) -> None:
+        if not self._path:
+            return
+        try:
+            # Tokens are live bearer credentials; keep the file owner-only
+            # rather than the default 0644.
+            fd = os.open(self._path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._entries, f)
+        except OSError as e:
+            logger.warning("Could not persist session cache %s: %s", self._path, e)
+
+
+def _build_retry(cfg: VsphereConfig) -> Retry:
+    """Retry schedule for the requests transport; identical for all clients
+    of one config, so the pool builds it once and shares it (Retry instances
+    are immutable — urllib3 derives per-attempt copies via .new())."""
+    return Retry(
+        total=cfg.request_retries,
+        backoff_factor=cfg.backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"HEAD", "GET", "POST", "PUT", "PATCH", "DELETE"}),
+        raise_on_status=False,
+    )
+
+
+def _safe_json(r: requests.Response) -> Optional[Dict[str, Any]]:
+    """Safely parse JSON response, returning None on failure."""
+    if not r.content:
+        return None
+    try:
+        if r.headers.get("content-type", "").startswith("application/json"):
+            return _loads(r.content)
+    except Exception:
+        pass
+    return None
+
+
+# Extra statuses treated as success on delete-style operations.
+_ALLOW_204 = frozenset({204})
+
+
+def _check_response(r: requests.Response, url: str, operation: str,
+                    allow: Optional[frozenset] = None) -> None:
+    """Raise VsphereApiError unless the response succeeded.
+
+    Runs on every request and almost always falls through, so the success
+    check is a bare status-range test (also keeps httpx responses, which
+    have no .ok, working) with pre-built frozensets for the allow cases —
+    no per-call list allocation.
+    """
+    if r.status_code < 400 or (allow is not None and r.status_code in allow):
+        return
+    raise VsphereApiError(
+        f"Failed to {operation}",
+        status_code=r.status_code,
+        response_body=_safe_json(r),
+        path=url,
+    )
+
+
+def _url_templates(base: str, prefix: str) -> Dict[str, str]:
+    """Per-operation full-URL templates for one API mode ("/api" or "/rest").
+
+    Static ops get a ready-to-send URL; parameterized ones need only a
+    %-format, so no per-call base+path concatenation remains on the hot path.
+    """
+    root = f"{base}{prefix}/vcenter"
+    return {
+        "vm_list": f"{root}/vm",
+        "vm": f"{root}/vm/%s",
+        "vm_power_start": f"{root}/vm/%s/power/start",
+        "vm_power_stop": f"{root}/vm/%s/power/stop",
+        "vm_power_reset": f"{root}/vm/%s/power/reset",
+        "host_list": f"{root}/host",
+        "datastore_list": f"{root}/datastore",
+        "network_list": f"{root}/network",
+        "datacenter_list": f"{root}/datacenter",
+        "vm_snapshot_list": f"{root}/vm/%s/snapshot",
+        "vm_snapshot": f"{root}/vm/%s/snapshot/%s",
+        "vm_cpu": f"{root}/vm/%s/hardware/cpu",
+        "vm_memory": f"{root}/vm/%s/hardware/memory",
+    }
+
+
 class VsphereClient:
     """Thread-safe vCenter REST API client with session management."""
 
-    def __init__(self, cfg: VsphereConfig):
+    def __init__(self, cfg: VsphereConfig, host: Optional[str] = None,
+                 token_cache: Optional[SessionTokenCache] = None,
+                 retry: Optional[Retry] = None):
         self._cfg = cfg
-        self._session = requests.Session()
-        retry = Retry(
-            total=cfg.request_retries,
-            backoff_factor=cfg.backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods={"HEAD", "GET", "POST", "PUT", "PATCH", "DELETE"},
-            raise_on_status=False,
-        )
-        self._session.mount("https://", HTTPAdapter(max_retries=retry))
-        self._session.verify = cfg.ca_bundle or cfg.verify_ssl
+        self._host = host or cfg.host
+        self._token_cache = token_cache
+        self._cache_key = f"{cfg.user}@{self._host}"
         self._timeout = cfg.default_timeout_s
+        verify = cfg.ca_bundle or cfg.verify_ssl
+        self._is_httpx = cfg.transport == "httpx" and httpx is not None
+        if cfg.transport == "httpx" and httpx is None:
+            logger.warning("VSPHERE_TRANSPORT=httpx but httpx is not installed; falling back to requests")
+        self._adapter: Optional[HTTPAdapter] = None
+        # Body-less requests reuse cached PreparedRequests sent straight
+        # through the adapter, skipping requests' per-call prepare/merge
+        # pipeline (see _request). Unused under httpx, where a single HTTP/2
+        # connection multiplexes concurrent calls instead.
+        self._prepared_cache: Dict[tuple, requests.PreparedRequest] = {}
+        if self._is_httpx:
+            limits = httpx.Limits(
+                max_connections=cfg.pool_maxsize,
+                max_keepalive_connections=cfg.pool_maxsize,
+            )
+            # httpx retries cover connect failures only; status-based retries
+            # from urllib3's Retry are not replicated here.
+            try:
+                transport = httpx.HTTPTransport(
+                    http2=True, verify=verify, limits=limits, retries=cfg.request_retries,
+                )
+            except ImportError:
+                logger.warning("h2 is not installed; httpx transport will speak HTTP/1.1")
+                transport = httpx.HTTPTransport(
+                    verify=verify, limits=limits, retries=cfg.request_retries,
+                )
+            self._session = httpx.Client(transport=transport, timeout=self._timeout)
+        else:
+            self._session = requests.Session()
+            if retry is None:
+                retry = _build_retry(cfg)
+            # Default urllib3 pools keep a single connection per host; concurrent
+            # tool calls against the same vCenter would otherwise open and discard
+            # a TCP+TLS connection each.
+            #
+            # urllib3 2.x (required by pyproject) performs no per-request
+            # stale-connection probe — the recv-peek check older releases did
+            # before each send is gone, so reused keep-alive connections cost
+            # no extra syscall here. The tradeoff is that a connection the
+            # server silently closed is only discovered when the send fails;
+            # pool_block=False plus the Retry above absorb that race by
+            # retrying on a fresh connection rather than blocking on the pool.
+            adapter = HTTPAdapter(
+                pool_connections=cfg.pool_maxsize,
+                pool_maxsize=cfg.pool_maxsize,
+                max_retries=retry,
+                pool_block=False,
+            )
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+            self._adapter = adapter
+            self._session.verify = verify
+            # requests' default Accept-Encoding stops at gzip/deflate; vCenter
+            # also speaks brotli, which compresses large VM inventories better.
+            # urllib3 transparently decodes br since the brotli package is a
+            # dependency, and the decompressed bytes feed orjson directly via
+            # r.content. Keep-alive is the HTTP/1.1 default but stated
+            # explicitly; the httpx/HTTP-2 branch must not send a Connection
+            # header, so neither applies there.
+            self._session.headers["Accept-Encoding"] = "br, gzip, deflate"
+            self._session.headers["Connection"] = "keep-alive"
         self._lock = threading.Lock()
         self._session_id: Optional[str] = None
-        self._base = f"https://{cfg.host}"
+        self._auth_headers: Dict[str, str] = {}
+        self._base = f"https://{self._host}"
         self._api_mode = "api" if cfg.api_mode == "api" else "rest"
+        # Precompute the per-operation full URLs for the active API mode, so
+        # request methods do a dict lookup (plus a %-format for parameterized
+        # ops) instead of rebuilding base+path strings per call.
+        prefix = "/api" if self._api_mode == "api" else "/rest"
+        self._extract_rest = self._api_mode == "rest"
+        self._urls = _url_templates(self._base, prefix)
+        # Short-TTL cache for the inventory list endpoints; entries are
+        # (monotonic timestamp, extracted value). Reads/writes are plain
+        # GIL-atomic dict ops — a racing miss just refetches.
+        self._list_cache: Dict[str, Tuple[float, Any]] = {}
+        self._list_ttl = cfg.list_cache_ttl_s
+        # (etag, last 200 response) per GET URL for If-None-Match revalidation.
+        self._etag_cache: Dict[str, Tuple[str, requests.Response]] = {}
         self._last_used: float = 0.0
+        # Shared response-meta skeleton; the host never changes for a client,
+        # so every tool response can reference this one dict.
+        self.meta: Dict[str, str] = {"host": self._host}
 
     @property
     def host(self) -> str:
-        return self._cfg.host
+        return self._host
 
     @property
     def is_authenticated(self) -> bool:
         return self._session_id is not None
 
     def _auth_header(self) -> Dict[str, str]:
-        return {"vmware-api-session-id": self._session_id} if self._session_id else {}
+        # Rebuilt only when the session id changes, so no per-request dict
+        # allocation.
+        return self._auth_headers
+
+    def _probe_session(self, token: str) -> bool:
+        """Check whether a cached session token is still accepted by vCenter."""
+        if self._api_mode == "api":
+            url = f"{self._base}/api/session"
+        else:
+            url = f"{self._base}/rest/com/vmware/cis/session"
+        try:
+            r = self._session.get(url, headers={"vmware-api-session-id": token}, timeout=self._timeout)
+        except _TRANSPORT_ERRORS:
+            return False
+        return r.status_code < 400
 
     def login(self) -> None:
         with self._lock:
             if self._session_id:
                 return
+            # Try a cached session first: a probe is one cheap GET versus a
+            # Basic-auth login that counts against vCenter's session limit.
+            if self._token_cache is not None:
+                cached = self._token_cache.get(self._cache_key)
+                if cached and self._probe_session(cached):
+                    self._session_id = cached
+                    self._auth_headers = {"vmware-api-session-id": cached}
+                    self._last_used = time.monotonic()
+                    logger.debug("Reusing cached session for %s", self._host)
+                    return
             if self._api_mode == "api":
                 url = f"{self._base}/api/session"
                 r = self._session.post(url, timeout=self._timeout, auth=(self._cfg.user, self._cfg.password))
-                if r.ok:
+                if r.status_code < 400:
                     token = None
                     try:
-                        token = r.json()
+                        token = _loads(r.content)
                         if isinstance(token, dict) and "value" in token:
                             token = token["value"]
                         elif isinstance(token, (list, dict)):
@@ -154,8 +431,11 @@ class VsphereClient:
                     if not token:
                         raise RuntimeError("vCenter /api/session returned no token")
                     self._session_id = token
+                    self._auth_headers = {"vmware-api-session-id": token}
                     self._last_used = time.monotonic()
-                    logger.debug("Logged in to %s via /api/session", self._cfg.host)
+                    if self._token_cache is not None:
+                        self._token_cache.put(self._cache_key, token)
+                    logger.debug("Logged in to %s via /api/session", self._host)
                     return
                 else:
                     # /api login failed, try /rest
@@ -164,19 +444,22 @@ class VsphereClient:
             # Fallback to /rest
             url = f"{self._base}/rest/com/vmware/cis/session"
             r = self._session.post(url, timeout=self._timeout, auth=(self._cfg.user, self._cfg.password))
-            if not r.ok:
+            if r.status_code >= 400:
                 raise VsphereApiError(
                     "Login failed",
                     status_code=r.status_code,
-                    response_body=self._safe_json(r),
+                    response_body=_safe_json(r),
                     path=url,
                 )
-            token = r.json().get("value")
+            token = _loads(r.content).get("value")
             if not token:
                 raise RuntimeError("vCenter /rest/com/vmware/cis/session returned no token")
             self._session_id = token
+            self._auth_headers = {"vmware-api-session-id": token}
             self._last_used = time.monotonic()
-            logger.debug("Logged in to %s via /rest/com/vmware/cis/session", self._cfg.host)
+            if self._token_cache is not None:
+                self._token_cache.put(self._cache_key, token)
+            logger.debug("Logged in to %s via /rest/com/vmware/cis/session", self._host)
 
     def logout(self) -> None:
         """Terminate the vCenter session."""
@@ -189,11 +472,14 @@ class VsphereClient:
                 else:
                     url = f"{self._base}/rest/com/vmware/cis/session"
                 self._session.delete(url, headers=self._auth_header(), timeout=self._timeout)
-                logger.debug("Logged out from %s", self._cfg.host)
+                logger.debug("Logged out from %s", self._host)
             except Exception as e:
-                logger.warning("Logout failed for %s: %s", self._cfg.host, e)
+                logger.warning("Logout failed for %s: %s", self._host, e)
             finally:
                 self._session_id = None
+                self._auth_headers = {}
+                if self._token_cache is not None:
+                    self._token_cache.invalidate(self._cache_key)
 
     def close(self) -> None:
         """Logout and close the underlying HTTP session."""
@@ -204,138 +490,206 @@ class VsphereClient:
         """Update last-used timestamp."""
         self._last_used = time.monotonic()
 
-    @staticmethod
-    def _safe_json(r: requests.Response) -> Optional[Dict[str, Any]]:
-        """Safely parse JSON response, returning None on failure."""
-        try:
-            if r.headers.get("content-type", "").startswith("application/json"):
-                return r.json()
-        except Exception:
-            pass
-        return None
+    @property
+    def last_used(self) -> float:
+        """time.monotonic() of the most recent request."""
+        return self._last_used
 
-    def _check_response(
-        self,
-        r: requests.Response,
-        path: str,
-        operation: str,
-        allow_statuses: Optional[List[int]] = None,
-    ) -> None:
-        """
-        Validate response and raise VsphereApiError on failure.
-        
-        Args:
-            r: The requests Response object
-            path: API path for error context
-            operation: Human-readable operation name (e.g., "list VMs")
-            allow_statuses: Additional status codes to treat as success (beyond 2xx)
-        """
-        allow_statuses = allow_statuses or []
-        
-        if r.ok or r.status_code in allow_statuses:
-            return
-        
-        raise VsphereApiError(
-            f"Failed to {operation}",
-            status_code=r.status_code,
-            response_body=self._safe_json(r),
-            path=path,
-        )
+    def ping(self) -> None:
+        """Hit the session endpoint so vCenter's idle timer is reset."""
+        if self._api_mode == "api":
+            self._request("GET", f"{self._base}/api/session")
+        else:
+            self._request("GET", f"{self._base}/rest/com/vmware/cis/session")
 
-    def _request(self, method: str, path: str, *, params: Optional[Dict[str, Any]] = None,
+    def _request(self, method: str, url: str, *, params: Optional[Dict[str, Any]] = None,
                  json_body: Optional[Any] = None) -> requests.Response:
         self.touch()
-        url = f"{self._base}{path}"
-        headers = self._auth_header()
-        r = self._session.request(method, url, headers=headers, params=params, json=json_body, timeout=self._timeout)
+        # Conditional GETs: body-less GETs whose last 200 carried an ETag are
+        # revalidated with If-None-Match, so an unchanged inventory poll costs
+        # a 304 with no payload instead of re-transferring the full JSON.
+        conditional = method == "GET" and params is None and json_body is None
+        etag_entry = self._etag_cache.get(url) if conditional else None
+
+        def send() -> requests.Response:
+            if self._is_httpx:
+                # One multiplexed HTTP/2 connection; no prepared-request fast
+                # path needed since httpx has no per-call merge pipeline.
+                headers = self._auth_header()
+                if etag_entry is not None:
+                    headers = {**headers, "If-None-Match": etag_entry[0]}
+                return self._session.request(
+                    method, url, headers=headers, params=params,
+                    json=json_body, timeout=self._timeout,
+                )
+            if params is None and json_body is None:
+                # Fast path for the closed set of body-less calls this client
+                # makes: prepare once per (method, url), then clone and stamp
+                # the auth header. vCenter does not redirect or use cookies,
+                # so sending via the adapter directly is safe.
+                key = (method, url)
+                prepared = self._prepared_cache.get(key)
+                if prepared is None:
+                    if len(self._prepared_cache) >= 512:
+                        self._prepared_cache.clear()
+                    prepared = self._session.prepare_request(requests.Request(method, url))
+                    self._prepared_cache[key] = prepared
+                p = prepared.copy()
+                p.headers.update(self._auth_header())
+                if etag_entry is not None:
+                    p.headers["If-None-Match"] = etag_entry[0]
+                return self._adapter.send(p, timeout=self._timeout, verify=self._session.verify)
+            return self._session.request(
+                method, url, headers=self._auth_header(), params=params,
+                json=json_body, timeout=self._timeout,
+            )
+
+        prev_token = self._session_id
+        r = send()
         if r.status_code == 401:
+            # Double-checked re-login: under an expiry storm only the first
+            # caller to see the 401 re-authenticates; the rest observe the
+            # replaced token and just resend with it.
             with self._lock:
-                self._session_id = None
-            self.login()
-            headers = self._auth_header()
-            r = self._session.request(method, url, headers=headers, params=params, json=json_body, timeout=self._timeout)
+                relogin = self._session_id == prev_token or self._session_id is None
+                if relogin:
+                    self._session_id = None
+                    self._auth_headers = {}
+                    self._list_cache.clear()
+                    if self._token_cache is not None:
+                        self._token_cache.invalidate(self._cache_key)
+            if relogin:
+                self.login()
+            r = send()
+        if conditional:
+            if etag_entry is not None and r.status_code == 304:
+                # Not modified: replay the response from the previous 200.
+                return etag_entry[1]
+            if r.status_code == 200:
+                etag = r.headers.get("ETag")
+                if etag:
+                    if len(self._etag_cache) >= 256:
+                        self._etag_cache.clear()
+                    self._etag_cache[url] = (etag, r)
         return r
 
-    def _v(self, rest: str, api: str) -> str:
-        return api if self._api_mode == "api" else rest
-
     def _extract_value(self, r: requests.Response) -> Any:
         """Extract value from response, handling /api vs /rest format differences."""
-        data = r.json()
-        if self._api_mode == "rest" and isinstance(data, dict) and "value" in data:
+        data = _loads(r.content)
+        if self._extract_rest and isinstance(data, dict) and "value" in data:
             return data["value"]
         return data
 
     # --- VM Operations ---
 
     def list_vms(self) -> Any:
-        path = self._v("/rest/vcenter/vm", "/api/vcenter/vm")
-        r = self._request("GET", path)
-        self._check_response(r, path, "list VMs")
+        url = self._urls["vm_list"]
+        r = self._request("GET", url)
+        _check_response(r, url, "list VMs")
         return self._extract_value(r)
 
     def get_vm(self, vm: str) -> Any:
-        path = self._v(f"/rest/vcenter/vm/{vm}", f"/api/vcenter/vm/{vm}")
-        r = self._request("GET", path)
-        self._check_response(r, path, f"get VM '{vm}'")
+        url = self._urls["vm"] % vm
+        r = self._request("GET", url)
+        _check_response(r, url, f"get VM '{vm}'")
         return self._extract_value(r)
 
     def power_start(self, vm: str) -> Any:
-        path = self._v(f"/rest/vcenter/vm/{vm}/power/start", f"/api/vcenter/vm/{vm}/power/start")
-        r = self._request("POST", path)
-        self._check_response(r, path, f"power on VM '{vm}'")
-        return self._safe_json(r) or {}
+        url = self._urls["vm_power_start"] % vm
+        r = self._request("POST", url)
+        _check_response(r, url, f"power on VM '{vm}'")
+        if r.status_code == 204 or not r.content:
+            return {}
+        return _safe_json(r) or {}
 
     def power_stop(self, vm: str) -> Any:
-        path = self._v(f"/rest/vcenter/vm/{vm}/power/stop", f"/api/vcenter/vm/{vm}/power/stop")
-        r = self._request("POST", path)
-        self._check_response(r, path, f"power off VM '{vm}'")
-        return self._safe_json(r) or {}
+        url = self._urls["vm_power_stop"] % vm
+        r = self._request("POST", url)
+        _check_response(r, url, f"power off VM '{vm}'")
+        if r.status_code == 204 or not r.content:
+            return {}
+        return _safe_json(r) or {}
 
     def power_reset(self, vm: str) -> Any:
-        path = self._v(f"/rest/vcenter/vm/{vm}/power/reset", f"/api/vcenter/vm/{vm}/power/reset")
-        r = self._request("POST", path)
-        self._check_response(r, path, f"reset VM '{vm}'")
-        return self._safe_json(r) or {}
+        url = self._urls["vm_power_reset"] % vm
+        r = self._request("POST", url)
+        _check_response(r, url, f"reset VM '{vm}'")
+        if r.status_code == 204 or not r.content:
+            return {}
+        return _safe_json(r) or {}
 
     def delete_vm(self, vm: str) -> Any:
-        path = self._v(f"/rest/vcenter/vm/{vm}", f"/api/vcenter/vm/{vm}")
-        r = self._request("DELETE", path)
-        self._check_response(r, path, f"delete VM '{vm}'", allow_statuses=[204])
-        return self._safe_json(r) or {}
+        url = self._urls["vm"] % vm
+        r = self._request("DELETE", url)
+        _check_response(r, url, f"delete VM '{vm}'", allow=_ALLOW_204)
+        if r.status_code == 204 or not r.content:
+            return {}
+        return _safe_json(r) or {}
 
     # --- Host/Datacenter/Network/Datastore ---
 
+    def _cached_get(self, key: str, url: str, operation: str) -> Any:
+        """GET an inventory list, serving repeats within the TTL from memory.
+
+        Name-resolution loops call the same list endpoints back-to-back;
+        this kind of inventory changes on human timescales, so a cache hit
+        (one dict lookup) replaces a full HTTPS round trip.
+        """
+        ttl = self._list_ttl
+        if ttl > 0:
+            entry = self._list_cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                return entry[1]
+        r = self._request("GET", url)
+        _check_response(r, url, operation)
+        value = self._extract_value(r)
+        if ttl > 0:
+            self._list_cache[key] = (time.monotonic(), value)
+        return value
+
+    def invalidate_inventory(self) -> None:
+        """Drop cached list_* responses (e.g. after a mutation or re-login)."""
+        self._list_cache.clear()
+        self._etag_cache.clear()
+
     def list_hosts(self) -> Any:
-        path = self._v("/rest/vcenter/host", "/api/vcenter/host")
-        r = self._request("GET", path)
-        self._check_response(r, path, "list hosts")
-        return self._extract_value(r)
+        return self._cached_get("hosts", self._urls["host_list"], "list hosts")
 
     def list_datastores(self) -> Any:
-        path = self._v("/rest/vcenter/datastore", "/api/vcenter/datastore")
-        r = self._request("GET", path)
-        self._check_response(r, path, "list datastores")
-        return self._extract_value(r)
+        return self._cached_get("datastores", self._urls["datastore_list"], "list datastores")
 
     def list_networks(self) -> Any:
-        path = self._v("/rest/vcenter/network", "/api/vcenter/network")
-        r = self._request("GET", path)
-        self._check_response(r, path, "list networks")
-        return self._extract_value(r)
+        return self._cached_get("networks", self._urls["network_list"], "list networks")
 
     def list_datacenters(self) -> Any:
-        path = self._v("/rest/vcenter/datacenter", "/api/vcenter/datacenter")
-        r = self._request("GET", path)
-        self._check_response(r, path, "list datacenters")
-        return self._extract_value(r)
+        return self._cached_get("datacenters", self._urls["datacenter_list"], "list datacenters")
+
+    def list_inventory(self) -> Dict[str, Any]:
+        """Fetch hosts, datastores, networks, and datacenters concurrently.
+
+        The four reads are independent round trips, so they are dispatched
+        through a shared thread pool and collapse to roughly the slowest
+        single call instead of four sequential ones.
+        """
+        futures = {
+            "hosts": _FANOUT_POOL.submit(self.list_hosts),
+            "datastores": _FANOUT_POOL.submit(self.list_datastores),
+            "networks": _FANOUT_POOL.submit(self.list_networks),
+            "datacenters": _FANOUT_POOL.submit(self.list_datacenters),
+        }
+        return {k: f.result() for k, f in futures.items()}
+
+    def bulk_get_vms(self, vm_ids: List[str]) -> Dict[str, Any]:
+        """Fetch details for several VMs concurrently, keyed by VM id."""
+        futures = {vm: _FANOUT_POOL.submit(self.get_vm, vm) for vm in vm_ids}
+        return {vm: f.result() for vm, f in futures.items()}
 
     # --- Snapshots ---
 
     def list_snapshots(self, vm: str) -> Any:
-        path = self._v(f"/rest/vcenter/vm/{vm}/snapshot", f"/api/vcenter/vm/{vm}/snapshot")
-        r = self._request("GET", path)
-        self._check_response(r, path, f"list snapshots for VM '{vm}'")
+        url = self._urls["vm_snapshot_list"] % vm
+        r = self._request("GET", url)
+        _check_response(r, url, f"list snapshots for VM '{vm}'")
         return self._extract_value(r)
 
     def create_snapshot(self, vm: str, name: str, description: str = "", memory: bool = False, quiesce: bool = False) -> Any:
@@ -345,16 +699,18 @@ class VsphereClient:
         else:
             body = {"description": description, "memory": memory, "name": name, "quiesce": quiesce}
         
-        path = self._v(f"/rest/vcenter/vm/{vm}/snapshot", f"/api/vcenter/vm/{vm}/snapshot")
-        r = self._request("POST", path, json_body=body)
-        self._check_response(r, path, f"create snapshot '{name}' for VM '{vm}'")
+        url = self._urls["vm_snapshot_list"] % vm
+        r = self._request("POST", url, json_body=body)
+        _check_response(r, url, f"create snapshot '{name}' for VM '{vm}'")
         return self._extract_value(r)
 
     def delete_snapshot(self, vm: str, snapshot: str) -> Any:
-        path = self._v(f"/rest/vcenter/vm/{vm}/snapshot/{snapshot}", f"/api/vcenter/vm/{vm}/snapshot/{snapshot}")
-        r = self._request("DELETE", path)
-        self._check_response(r, path, f"delete snapshot '{snapshot}' for VM '{vm}'", allow_statuses=[204])
-        return self._safe_json(r) or {}
+        url = self._urls["vm_snapshot"] % (vm, snapshot)
+        r = self._request("DELETE", url)
+        _check_response(r, url, f"delete snapshot '{snapshot}' for VM '{vm}'", allow=_ALLOW_204)
+        if r.status_code == 204 or not r.content:
+            return {}
+        return _safe_json(r) or {}
 
     # --- Hardware ---
 
@@ -365,10 +721,12 @@ class VsphereClient:
         else:
             body = {"count": count}
         
-        path = self._v(f"/rest/vcenter/vm/{vm}/hardware/cpu", f"/api/vcenter/vm/{vm}/hardware/cpu")
-        r = self._request("PATCH", path, json_body=body)
-        self._check_response(r, path, f"set CPU count to {count} for VM '{vm}'")
-        return self._safe_json(r) or {}
+        url = self._urls["vm_cpu"] % vm
+        r = self._request("PATCH", url, json_body=body)
+        _check_response(r, url, f"set CPU count to {count} for VM '{vm}'")
+        if r.status_code == 204 or not r.content:
+            return {}
+        return _safe_json(r) or {}
 
     def set_memory(self, vm: str, memory_mib: int) -> Any:
         body: Dict[str, Any]
@@ -377,91 +735,438 @@ class VsphereClient:
         else:
             body = {"size_MiB": memory_mib}
         
-        path = self._v(f"/rest/vcenter/vm/{vm}/hardware/memory", f"/api/vcenter/vm/{vm}/hardware/memory")
-        r = self._request("PATCH", path, json_body=body)
-        self._check_response(r, path, f"set memory to {memory_mib} MiB for VM '{vm}'")
-        return self._safe_json(r) or {}
+        url = self._urls["vm_memory"] % vm
+        r = self._request("PATCH", url, json_body=body)
+        _check_response(r, url, f"set memory to {memory_mib} MiB for VM '{vm}'")
+        if r.status_code == 204 or not r.content:
+            return {}
+        return _safe_json(r) or {}
+
+
+class AsyncVsphereClient:
+    """Async vCenter REST API client built on httpx.AsyncClient.
+
+    Fan-out reads (``asyncio.gather`` over ``list_*``/``get_vm``) overlap
+    many in-flight requests on a single event-loop thread, with no
+    per-thread session duplication or executor hand-off. The sync
+    VsphereClient remains what the MCP tools use; this variant requires
+    the "http2" extra.
+    """
+
+    def __init__(self, cfg: VsphereConfig, host: Optional[str] = None,
+                 token_cache: Optional[SessionTokenCache] = None):
+        if httpx is None:
+            raise RuntimeError("AsyncVsphereClient requires httpx; install the http2 extra")
+        self._cfg = cfg
+        self._host = host or cfg.host
+        self._token_cache = token_cache
+        self._cache_key = f"{cfg.user}@{self._host}"
+        self._timeout = cfg.default_timeout_s
+        verify = cfg.ca_bundle or cfg.verify_ssl
+        limits = httpx.Limits(
+            max_connections=cfg.pool_maxsize,
+            max_keepalive_connections=cfg.pool_maxsize,
+        )
+        try:
+            transport = httpx.AsyncHTTPTransport(
+                http2=True, verify=verify, limits=limits, retries=cfg.request_retries,
+            )
+        except ImportError:
+            logger.warning("h2 is not installed; async httpx transport will speak HTTP/1.1")
+            transport = httpx.AsyncHTTPTransport(
+                verify=verify, limits=limits, retries=cfg.request_retries,
+            )
+        self._session = httpx.AsyncClient(transport=transport, timeout=self._timeout)
+        self._lock = asyncio.Lock()
+        self._session_id: Optional[str] = None
+        self._auth_headers: Dict[str, str] = {}
+        self._base = f"https://{self._host}"
+        self._api_mode = "api" if cfg.api_mode == "api" else "rest"
+        prefix = "/api" if self._api_mode == "api" else "/rest"
+        self._extract_rest = self._api_mode == "rest"
+        self._urls = _url_templates(self._base, prefix)
+        self.meta: Dict[str, str] = {"host": self._host}
+
+    # Value extraction is transport-agnostic, so the sync client's helper
+    # is reused verbatim.
+    _extract_value = VsphereClient._extract_value
+
+    @property
+    def host(self) -> str:
+        return self._host
+
+    @property
+    def is_authenticated(self) -> bool:
+        return self._session_id is not None
+
+    def _auth_header(self) -> Dict[str, str]:
+        return self._auth_headers
+
+    async def _probe_session(self, token: str) -> bool:
+        """Check whether a cached session token is still accepted by vCenter."""
+        if self._api_mode == "api":
+            url = f"{self._base}/api/session"
+        else:
+            url = f"{self._base}/rest/com/vmware/cis/session"
+        try:
+            r = await self._session.get(url, headers={"vmware-api-session-id": token})
+        except httpx.HTTPError:
+            return False
+        return r.status_code < 400
+
+    async def login(self) -> None:
+        async with self._lock:
+            if self._session_id:
+                return
+            if self._token_cache is not None:
+                cached = self._token_cache.get(self._cache_key)
+                if cached and await self._probe_session(cached):
+                    self._session_id = cached
+                    self._auth_headers = {"vmware-api-session-id": cached}
+                    logger.debug("Reusing cached session for %s", self._host)
+                    return
+            if self._api_mode == "api":
+                url = f"{self._base}/api/session"
+                r = await self._session.post(url, auth=(self._cfg.user, self._cfg.password))
+                if r.status_code < 400:
+                    token = None
+                    try:
+                        token = _loads(r.content)
+                        if isinstance(token, dict) and "value" in token:
+                            token = token["value"]
+                        elif isinstance(token, (list, dict)):
+                            token = None
+                    except Exception:
+                        token = r.text.strip() or None
+                    if not token:
+                        token = r.headers.get("vmware-api-session-id") or r.cookies.get("vmware-api-session-id")
+                    if not token:
+                        raise RuntimeError("vCenter /api/session returned no token")
+                    self._session_id = token
+                    self._auth_headers = {"vmware-api-session-id": token}
+                    if self._token_cache is not None:
+                        self._token_cache.put(self._cache_key, token)
+                    logger.debug("Logged in to %s via /api/session (async)", self._host)
+                    return
+                else:
+                    # /api login failed, try /rest
+                    logger.debug("/api/session failed with %d, trying /rest", r.status_code)
+
+            # Fallback to /rest
+            url = f"{self._base}/rest/com/vmware/cis/session"
+            r = await self._session.post(url, auth=(self._cfg.user, self._cfg.password))
+            if r.status_code >= 400:
+                raise VsphereApiError(
+                    "Login failed",
+                    status_code=r.status_code,
+                    response_body=_safe_json(r),
+                    path=url,
+                )
+            token = None
+            try:
+                data = _loads(r.content)
+                if isinstance(data, dict):
+                    token = data.get("value")
+            except Exception:
+                pass
+            if not token:
+                token = r.headers.get("vmware-api-session-id")
+            if not token:
+                raise RuntimeError("vCenter /rest/com/vmware/cis/session returned no token")
+            self._session_id = token
+            self._auth_headers = {"vmware-api-session-id": token}
+            if self._token_cache is not None:
+                self._token_cache.put(self._cache_key, token)
+            logger.debug("Logged in to %s via /rest/com/vmware/cis/session (async)", self._host)
+
+    async def logout(self) -> None:
+        """Terminate the vCenter session."""
+        async with self._lock:
+            if not self._session_id:
+                return
+            try:
+                if self._api_mode == "api":
+                    url = f"{self._base}/api/session"
+                else:
+                    url = f"{self._base}/rest/com/vmware/cis/session"
+                await self._session.delete(url, headers=self._auth_header())
+                logger.debug("Logged out from %s", self._host)
+            except Exception as e:
+                logger.warning("Logout failed for %s: %s", self._host, e)
+            finally:
+                self._session_id = None
+                self._auth_headers = {}
+                if self._token_cache is not None:
+                    self._token_cache.invalidate(self._cache_key)
+
+    async def close(self) -> None:
+        """Logout and close the underlying HTTP client."""
+        await self.logout()
+        await self._session.aclose()
+
+    async def _request(self, method: str, url: str, *, params: Optional[Dict[str, Any]] = None,
+                       json_body: Optional[Any] = None) -> Any:
+
+        async def send() -> Any:
+            return await self._session.request(
+                method, url, headers=self._auth_header(), params=params, json=json_body,
+            )
+
+        prev_token = self._session_id
+        r = await send()
+        if r.status_code == 401:
+            # Same double-checked re-login as the sync client: only the
+            # first task to see the 401 re-authenticates.
+            async with self._lock:
+                relogin = self._session_id == prev_token or self._session_id is None
+                if relogin:
+                    self._session_id = None
+                    self._auth_headers = {}
+                    if self._token_cache is not None:
+                        self._token_cache.invalidate(self._cache_key)
+            if relogin:
+                await self.login()
+            r = await send()
+        return r
+
+    # --- VM Operations ---
+
+    async def list_vms(self) -> Any:
+        url = self._urls["vm_list"]
+        r = await self._request("GET", url)
+        _check_response(r, url, "list VMs")
+        return self._extract_value(r)
+
+    async def get_vm(self, vm: str) -> Any:
+        url = self._urls["vm"] % vm
+        r = await self._request("GET", url)
+        _check_response(r, url, f"get VM '{vm}'")
+        return self._extract_value(r)
+
+    # --- Host/Datacenter/Network/Datastore ---
+
+    async def list_hosts(self) -> Any:
+        url = self._urls["host_list"]
+        r = await self._request("GET", url)
+        _check_response(r, url, "list hosts")
+        return self._extract_value(r)
+
+    async def list_datastores(self) -> Any:
+        url = self._urls["datastore_list"]
+        r = await self._request("GET", url)
+        _check_response(r, url, "list datastores")
+        return self._extract_value(r)
+
+    async def list_networks(self) -> Any:
+        url = self._urls["network_list"]
+        r = await self._request("GET", url)
+        _check_response(r, url, "list networks")
+        return self._extract_value(r)
+
+    async def list_datacenters(self) -> Any:
+        url = self._urls["datacenter_list"]
+        r = await self._request("GET", url)
+        _check_response(r, url, "list datacenters")
+        return self._extract_value(r)
+
+    async def list_snapshots(self, vm: str) -> Any:
+        url = self._urls["vm_snapshot_list"] % vm
+        r = await self._request("GET", url)
+        _check_response(r, url, f"list snapshots for VM '{vm}'")
+        return self._extract_value(r)
+
+    async def list_inventory(self) -> Dict[str, Any]:
+        """Fetch hosts, datastores, networks, and datacenters concurrently."""
+        hosts, datastores, networks, datacenters = await asyncio.gather(
+            self.list_hosts(), self.list_datastores(),
+            self.list_networks(), self.list_datacenters(),
+        )
+        return {
+            "hosts": hosts, "datastores": datastores,
+            "networks": networks, "datacenters": datacenters,
+        }
+
+    async def bulk_get_vms(self, vm_ids: List[str]) -> Dict[str, Any]:
+        """Fetch details for several VMs concurrently, keyed by VM id."""
+        results = await asyncio.gather(*(self.get_vm(vm) for vm in vm_ids))
+        return dict(zip(vm_ids, results))
 
 
 class VsphereClientPool:
     """
-    Thread-safe pool of VsphereClient instances, one per vCenter host.
-    
-    Reuses authenticated sessions to avoid exhausting vCenter session limits.
+    Thread-safe pool of VsphereClient instances, one per (host, thread).
+
+    Each worker thread gets its own client so no two threads contend on a
+    shared requests.Session or its 401/login lock; the per-thread clients
+    share one SessionTokenCache, so only the first ever performs a full
+    login for a host and the rest reuse the cached session token.
     Automatically cleans up sessions on process exit.
     """
 
     def __init__(self, cfg: AppConfig):
         self._cfg = cfg
-        self._clients: Dict[str, VsphereClient] = {}
+        self._locals: Dict[str, threading.local] = {}
+        self._clients: Dict[str, List[VsphereClient]] = {}
         self._lock = threading.Lock()
+        self._token_cache = SessionTokenCache(
+            cfg.vsphere.session_cache_path, cfg.vsphere.session_cache_ttl_s
+        )
+        self._retry = _build_retry(cfg.vsphere)
+        self._stop = threading.Event()
+        self._keepalive_interval = cfg.vsphere.keepalive_interval_s
+        if self._keepalive_interval > 0:
+            threading.Thread(
+                target=self._keepalive_loop, name="vsphere-keepalive", daemon=True
+            ).start()
         atexit.register(self.close_all)
 
+    def _keepalive_loop(self) -> None:
+        """Ping idle authenticated clients so vCenter doesn't expire their sessions.
+
+        A periodic GET on the session endpoint is far cheaper than the
+        401 + re-login + retry round trips an expired session costs later.
+        """
+        interval = self._keepalive_interval
+        while not self._stop.wait(interval):
+            now = time.monotonic()
+            with self._lock:
+                clients = [c for cs in self._clients.values() for c in cs]
+            for client in clients:
+                if client.is_authenticated and now - client.last_used > interval:
+                    try:
+                        client.ping()
+                    except Exception as e:
+                        logger.debug("Keep-alive ping failed for %s: %s", client.host, e)
+
     def get(self, hostname: Optional[str] = None) -> VsphereClient:
         """
-        Get or create a VsphereClient for the specified host.
-        
+        Get or create this thread's VsphereClient for the specified host.
+
         Args:
             hostname: Target vCenter hostname. Defaults to configured VCENTER_HOST.
-            
+
         Returns:
-            Authenticated VsphereClient instance.
-            
+            Authenticated VsphereClient instance owned by the calling thread.
+
         Raises:
             PermissionError: If hostname is not in the allowed hosts list.
         """
         host = (hostname or self._cfg.vsphere.host).strip()
-        
+
         # Enforce allowed hosts
         if self._cfg.vsphere.allowed_hosts and host not in self._cfg.vsphere.allowed_hosts:
             raise PermissionError(f"Hostname '{host}' not in allowed set")
 
-        with self._lock:
-            if host in self._clients:
-                client = self._clients[host]
-                # Ensure still authenticated (may have been invalidated)
-                if not client.is_authenticated:
-                    client.login()
-                return client
-
-            # Create new client with host-specific config
-            host_cfg = self._cfg.vsphere.model_copy(deep=True)
-            host_cfg.host = host
-            
-            client = VsphereClient(host_cfg)
-            client.login()
-            self._clients[host] = client
-            logger.info("Created new client for %s (pool size: %d)", host, len(self._clients))
+        # Fast path: a plain dict read is atomic under the GIL, so the common
+        # cached-and-authenticated case needs no lock.
+        loc = self._locals.get(host)
+        if loc is None:
+            with self._lock:
+                loc = self._locals.get(host)
+                if loc is None:
+                    loc = self._locals[host] = threading.local()
+
+        client: Optional[VsphereClient] = getattr(loc, "client", None)
+        if client is not None:
+            # Ensure still authenticated (may have been invalidated)
+            if not client.is_authenticated:
+                client.login()
             return client
 
+        # First use of this host on this thread. login() goes through the
+        # shared token cache, so this is normally a cheap probe rather than
+        # a fresh vCenter session.
+        client = VsphereClient(self._cfg.vsphere, host=host, token_cache=self._token_cache,
+                               retry=self._retry)
+        client.login()
+        loc.client = client
+        with self._lock:
+            self._clients.setdefault(host, []).append(client)
+            total = sum(len(cs) for cs in self._clients.values())
+        logger.info("Created new client for %s on %s (pool size: %d)",
+                    host, threading.current_thread().name, total)
+        return client
+
     def remove(self, hostname: str) -> None:
-        """Remove and close a specific client from the pool."""
+        """Remove and close all clients for a specific host."""
         with self._lock:
-            if hostname in self._clients:
-                self._clients[hostname].close()
-                del self._clients[hostname]
-                logger.info("Removed client for %s from pool", hostname)
+            self._locals.pop(hostname, None)
+            clients = self._clients.pop(hostname, [])
+        for client in clients:
+            client.close()
+        if clients:
+            logger.info("Removed %d client(s) for %s from pool", len(clients), hostname)
 
     def close_all(self) -> None:
         """Close all clients in the pool. Called automatically on process exit."""
+        self._stop.set()
         with self._lock:
-            for host, client in list(self._clients.items()):
-                try:
-                    client.close()
-                    logger.debug("Closed client for %s", host)
-                except Exception as e:
-                    logger.warning("Error closing client for %s: %s", host, e)
+            for host, clients in list(self._clients.items()):
+                for client in clients:
+                    try:
+                        client.close()
+                        logger.debug("Closed client for %s", host)
+                    except Exception as e:
+                        logger.warning("Error closing client for %s: %s", host, e)
             self._clients.clear()
+            self._locals.clear()
             logger.info("Closed all clients in pool")
 
     @property
     def size(self) -> int:
         """Number of clients in the pool."""
         with self._lock:
-            return len(self._clients)
+            return sum(len(cs) for cs in self._clients.values())
 
     @property
     def hosts(self) -> list[str]:
         """List of hosts with active clients."""
         with self._lock:
             return list(self._clients.keys())
+
+
+class AsyncVsphereClientPool:
+    """Pool of AsyncVsphereClient instances, one per vCenter host.
+
+    All clients live on one event loop, so a single client per host
+    suffices (concurrent calls multiplex on its connection pool) and
+    teardown gathers the logouts instead of issuing them serially.
+    """
+
+    def __init__(self, cfg: AppConfig):
+        self._cfg = cfg
+        self._clients: Dict[str, AsyncVsphereClient] = {}
+        self._lock = asyncio.Lock()
+        self._token_cache = SessionTokenCache(
+            cfg.vsphere.session_cache_path, cfg.vsphere.session_cache_ttl_s
+        )
+
+    async def get(self, hostname: Optional[str] = None) -> AsyncVsphereClient:
+        """Get or create an authenticated client for the specified host."""
+        host = (hostname or self._cfg.vsphere.host).strip()
+        if self._cfg.vsphere.allowed_hosts and host not in self._cfg.vsphere.allowed_hosts:
+            raise PermissionError(f"Hostname '{host}' not in allowed set")
+        async with self._lock:
+            client = self._clients.get(host)
+            if client is None:
+                client = self._clients[host] = AsyncVsphereClient(
+                    self._cfg.vsphere, host=host, token_cache=self._token_cache
+                )
+        if not client.is_authenticated:
+            await client.login()
+        return client
+
+    async def close_all(self) -> None:
+        """Close all clients concurrently."""
+        async with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        results = await asyncio.gather(*(c.close() for c in clients), return_exceptions=True)
+        for client, res in zip(clients, results):
+            if isinstance(res, Exception):
+                logger.warning("Error closing client for %s: %s", client.host, res)
+
+    @property
+    def hosts(self) -> list[str]:
+        """List of hosts with active clients."""
+        return list(self._clients.keys())